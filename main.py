@@ -12,27 +12,39 @@ from src.core import (
 )
 from src.competence_mapper import CompetenceMapper
 
+_RULE = "=" * 70 + "\n"
+
 
 def main() -> None:
     """Run the main demonstration"""
-    print("=" * 70)
-    print("MORSKAMARY: Blue Sociology Competence Mapping")
-    print("=" * 70)
-    print()
+    # Output is collected and written once, so piped runs pay a single write
+    out: list[str] = []
+    try:
+        _run_demo(out)
+    finally:
+        sys.stdout.write("".join(out))
+
+
+def _run_demo(out: list[str]) -> None:
+    """Append the demonstration output lines to ``out``"""
+    out.append(_RULE)
+    out.append("MORSKAMARY: Blue Sociology Competence Mapping\n")
+    out.append(_RULE)
+    out.append("\n")
 
     # Initialize mapper
     mapper = CompetenceMapper()
 
     # Load sample competences
-    print("[1] Loading sample competences...")
+    out.append("[1] Loading sample competences...\n")
     competences = create_sample_competences()
     for comp in competences:
         mapper.add_competence(comp)
-        print(f"    - {comp.name} ({comp.axis.name} axis, {comp.level.name})")
-    print()
+        out.append(f"    - {comp.name} ({comp.axis.name} axis, {comp.level.name})\n")
+    out.append("\n")
 
     # Create sample micro-credentials
-    print("[2] Creating sample micro-credentials...")
+    out.append("[2] Creating sample micro-credentials...\n")
     credentials = [
         MicroCredential(
             id="cred_offshore_001",
@@ -52,56 +64,56 @@ def main() -> None:
 
     for cred in credentials:
         mapper.add_credentials(cred)
-        print(f"    - {cred.title} ({cred.sector} sector)")
-    print()
+        out.append(f"    - {cred.title} ({cred.sector} sector)\n")
+    out.append("\n")
 
     # Display mapping summary
-    print("[3] Competence Mapping Summary:")
+    out.append("[3] Competence Mapping Summary:\n")
     summary = mapper.get_summary()
-    print(f"    Total competences: {summary['total_competences']}")
-    print(f"    Total credentials: {summary['total_credentials']}")
-    print("    Competences by TMBD axis:")
+    out.append(f"    Total competences: {summary['total_competences']}\n")
+    out.append(f"    Total credentials: {summary['total_credentials']}\n")
+    out.append("    Competences by TMBD axis:\n")
     for axis, count in summary["competences_by_axis"].items():
-        print(f"      - {axis}: {count}")
-    print("    Competences by level:")
+        out.append(f"      - {axis}: {count}\n")
+    out.append("    Competences by level:\n")
     for level, count in summary["competences_by_level"].items():
-        print(f"      - {level}: {count}")
-    print()
+        out.append(f"      - {level}: {count}\n")
+    out.append("\n")
 
     # Demonstrate competence gap analysis
-    print("[4] Competence Gap Analysis Example:")
-    print("    User has: ['comp_marine_001']")
-    print("    Target sector: offshore-energy")
+    out.append("[4] Competence Gap Analysis Example:\n")
+    out.append("    User has: ['comp_marine_001']\n")
+    out.append("    Target sector: offshore-energy\n")
     gaps = mapper.analyze_competence_gaps(
         available=["comp_marine_001"],
         required_sector="offshore-energy",
     )
-    print("    Missing competences:")
+    out.append("    Missing competences:\n")
     for missing in gaps["missing"]:
         if missing in mapper.competences:
             comp = mapper.competences[missing]
-            print(f"      - {comp.name} ({comp.level.name})")
-    print()
+            out.append(f"      - {comp.name} ({comp.level.name})\n")
+    out.append("\n")
 
     # Suggest credential pathway
-    print("[5] Suggested Micro-Credential Pathway:")
+    out.append("[5] Suggested Micro-Credential Pathway:\n")
     pathway = mapper.suggest_credential_pathway()
     for i, cred in enumerate(pathway, 1):
-        print(f"    {i}. {cred.title}")
-        print(f"       Sector: {cred.sector}")
-        print(f"       Description: {cred.description}")
-    print()
-
-    print("=" * 70)
-    print("Setup complete! Core functionality is now available.")
-    print("=" * 70)
-    print()
-    print("Next steps:")
-    print("1. Install dependencies: pip install -r requirements.txt")
-    print("2. Run tests: pytest tests/")
-    print("3. Load your competence data: see src/core.py for examples")
-    print("4. Map to sectors and create credentials")
-    print()
+        out.append(f"    {i}. {cred.title}\n")
+        out.append(f"       Sector: {cred.sector}\n")
+        out.append(f"       Description: {cred.description}\n")
+    out.append("\n")
+
+    out.append(_RULE)
+    out.append("Setup complete! Core functionality is now available.\n")
+    out.append(_RULE)
+    out.append("\n")
+    out.append("Next steps:\n")
+    out.append("1. Install dependencies: pip install -r requirements.txt\n")
+    out.append("2. Run tests: pytest tests/\n")
+    out.append("3. Load your competence data: see src/core.py for examples\n")
+    out.append("4. Map to sectors and create credentials\n")
+    out.append("\n")
 
 
 if __name__ == "__main__":
@@ -2,7 +2,7 @@
 Competence mapping and analysis module for Blue Sociology
 """
 
-from typing import Any, Dict, List, Set, Tuple, TypedDict
+from typing import Any, Dict, List, Set, TypedDict
 from src.core import Competence, MicroCredential, BlueDynamicsAxis, CompetenceLevel
 
 
@@ -18,37 +18,85 @@ class CompetenceMapper:
     def __init__(self):
         self.competences: Dict[str, Competence] = {}
         self.credentials: Dict[str, MicroCredential] = {}
+        # Secondary indexes kept in step with self.competences by add_competence
+        self._by_axis: Dict[BlueDynamicsAxis, List[Competence]] = {
+            axis: [] for axis in BlueDynamicsAxis
+        }
+        self._by_level: Dict[CompetenceLevel, List[Competence]] = {
+            level: [] for level in CompetenceLevel
+        }
+        self._by_sector: Dict[str, List[MicroCredential]] = {}
+        # Credentials per sector as spelled on the credential, for get_summary
+        self._sector_counts: Dict[str, int] = {}
+        # Cached average competence level per credential id, refreshed when a
+        # credential or any competence it references is (re-)added
+        self._cred_avg: Dict[str, float] = {}
+        self._comp_to_creds: Dict[str, Set[str]] = {}
 
     def add_competence(self, competence: Competence) -> None:
-        """Add a competence to the mapper"""
+        """Add a competence to the mapper, replacing any with the same id"""
+        previous = self.competences.get(competence.id)
+        if previous is not None:
+            self._by_axis[previous.axis] = [
+                c for c in self._by_axis[previous.axis] if c.id != previous.id
+            ]
+            self._by_level[previous.level] = [
+                c for c in self._by_level[previous.level] if c.id != previous.id
+            ]
         self.competences[competence.id] = competence
+        self._by_axis[competence.axis].append(competence)
+        self._by_level[competence.level].append(competence)
+        for cred_id in self._comp_to_creds.get(competence.id, ()):
+            self._recompute_avg(self.credentials[cred_id])
 
     def add_credentials(self, credential: MicroCredential) -> None:
-        """Add a micro-credential to the mapper"""
+        """Add a micro-credential to the mapper, replacing any with the same id"""
+        previous = self.credentials.get(credential.id)
+        if previous is not None:
+            sector_key = previous.sector.lower()
+            self._by_sector[sector_key] = [
+                c for c in self._by_sector[sector_key] if c.id != previous.id
+            ]
+            for cid in previous.competences:
+                self._comp_to_creds[cid].discard(previous.id)
+            self._sector_counts[previous.sector] -= 1
+            if not self._sector_counts[previous.sector]:
+                del self._sector_counts[previous.sector]
         self.credentials[credential.id] = credential
+        self._sector_counts[credential.sector] = (
+            self._sector_counts.get(credential.sector, 0) + 1
+        )
+        self._by_sector.setdefault(credential.sector.lower(), []).append(credential)
+        for cid in credential.competences:
+            self._comp_to_creds.setdefault(cid, set()).add(credential.id)
+        self._recompute_avg(credential)
+
+    def _recompute_avg(self, credential: MicroCredential) -> None:
+        """Refresh the cached average competence level of a credential"""
+        self._cred_avg[credential.id] = sum(
+            self.competences[cid].level
+            for cid in credential.competences
+            if cid in self.competences
+        ) / max(1, len(credential.competences))
 
     def get_competences_by_axis(self, axis: BlueDynamicsAxis) -> List[Competence]:
         """Get all competences for a specific TMBD axis"""
-        return [c for c in self.competences.values() if c.axis == axis]
+        return list(self._by_axis[axis])
 
     def get_competences_by_level(self, level: CompetenceLevel) -> List[Competence]:
         """Get all competences at a specific proficiency level"""
-        return [c for c in self.competences.values() if c.level == level]
+        return list(self._by_level[level])
 
     def get_sector_competences(self, sector: str) -> List[str]:
         """Get competence IDs required for a specific sector"""
-        sector_lower = sector.lower()
-        sector_credentials = [
-            cred
-            for cred in self.credentials.values()
-            if cred.sector.lower() == sector_lower
-        ]
+        return list(self._sector_competence_ids(sector))
 
+    def _sector_competence_ids(self, sector: str) -> Set[str]:
+        """Union of competence IDs over the credentials indexed for a sector"""
         all_competences: Set[str] = set()
-        for cred in sector_credentials:
+        for cred in self._by_sector.get(sector.lower(), []):
             all_competences.update(cred.competences)
-
-        return list(all_competences)
+        return all_competences
 
     def analyze_competence_gaps(
         self, available: List[str], required_sector: str
@@ -63,7 +111,7 @@ class CompetenceMapper:
         Returns:
             Dict with 'available', 'missing', and 'by_level' breakdown
         """
-        required = set(self.get_sector_competences(required_sector))
+        required = self._sector_competence_ids(required_sector)
         available_set = set(available)
 
         missing = required - available_set
@@ -74,14 +122,16 @@ class CompetenceMapper:
             "by_level": {},
         }
 
+        # Bucket missing ids in one pass, then emit levels in enum order
+        missing_by_level: Dict[CompetenceLevel, List[str]] = {}
+        competences = self.competences
+        for cid in missing:
+            competence = competences.get(cid)
+            if competence is not None:
+                missing_by_level.setdefault(competence.level, []).append(cid)
         for level in CompetenceLevel:
-            level_missing = [
-                cid
-                for cid in missing
-                if cid in self.competences and self.competences[cid].level == level
-            ]
-            if level_missing:
-                result["by_level"][level.name] = level_missing
+            if level in missing_by_level:
+                result["by_level"][level.name] = missing_by_level[level]
 
         return result
 
@@ -97,36 +147,25 @@ class CompetenceMapper:
         Returns:
             List of credentials ordered by progression
         """
-        # Group credentials by average competence level
-        credential_levels: List[Tuple[MicroCredential, float]] = []
-
-        for cred in self.credentials.values():
-            avg_level = sum(
-                self.competences[cid].level.value
-                for cid in cred.competences
-                if cid in self.competences
-            ) / max(1, len(cred.competences))
-            credential_levels.append((cred, avg_level))
-
-        # Sort by level
-        credential_levels.sort(key=lambda x: x[1])
-
-        return [cred for cred, _ in credential_levels]
+        # Order credentials by their cached average competence level
+        return sorted(
+            self.credentials.values(), key=lambda cred: self._cred_avg[cred.id]
+        )
 
     def get_summary(self) -> Dict[str, Any]:
-        """Get a summary of all mapped competences and credentials"""
-        axis_counts: Dict[str, int] = {axis.name: 0 for axis in BlueDynamicsAxis}
-        level_counts: Dict[str, int] = {level.name: 0 for level in CompetenceLevel}
-        for competence in self.competences.values():
-            axis_counts[competence.axis.name] += 1
-            level_counts[competence.level.name] += 1
+        """Get a summary of all mapped competences and credentials
 
-        sectors = set(cred.sector for cred in self.credentials.values())
+        Built from the maintained indexes, so it never iterates competences.
+        """
+        axis_counts = {axis.name: len(comps) for axis, comps in self._by_axis.items()}
+        level_counts = {
+            level.name: len(comps) for level, comps in self._by_level.items()
+        }
 
         return {
             "total_competences": len(self.competences),
             "total_credentials": len(self.credentials),
             "competences_by_axis": axis_counts,
             "competences_by_level": level_counts,
-            "sectors": list(sectors),
+            "sectors": list(self._sector_counts),
         }
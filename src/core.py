@@ -5,7 +5,7 @@ Core utilities and data structures for Blue Sociology analysis
 from pathlib import Path
 from typing import Any, Dict, List, Union
 from dataclasses import dataclass
-from enum import Enum
+from enum import Enum, IntEnum
 
 
 class BlueDynamicsAxis(Enum):
@@ -119,6 +119,8 @@ _AXIS_THEME_KEYWORDS: Dict[BlueDynamicsAxis, List[str]] = {
     ],
 }
 
+_AXIS_BY_NAME: Dict[str, BlueDynamicsAxis] = {axis.name: axis for axis in BlueDynamicsAxis}
+
 
 def _detect_all_themes(record: Dict[str, Any]) -> Dict[BlueDynamicsAxis, List[str]]:
     """Detect per-axis thematic keywords from record text.
@@ -140,8 +142,8 @@ def _detect_all_themes(record: Dict[str, Any]) -> Dict[BlueDynamicsAxis, List[st
     return themes
 
 
-class CompetenceLevel(Enum):
-    """Competence proficiency levels"""
+class CompetenceLevel(IntEnum):
+    """Competence proficiency levels (ordered, usable directly as ints)"""
 
     FOUNDATIONAL = 1
     INTERMEDIATE = 2
@@ -149,7 +151,10 @@ class CompetenceLevel(Enum):
     EXPERT = 4
 
 
-@dataclass
+_LEVEL_BY_NAME: Dict[str, CompetenceLevel] = {level.name: level for level in CompetenceLevel}
+
+
+@dataclass(slots=True, frozen=True)
 class Competence:
     """
     Represents a single competence in Blue Sociology context
@@ -182,7 +187,7 @@ class Competence:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MicroCredential:
     """
     Represents a stackable micro-credential
@@ -233,7 +238,6 @@ def load_competence_matrix(file_path: Union[str, Path]) -> List[Competence]:
         else:
             raise ValueError(f"Unsupported file format: {path}")
 
-        competences = []
         ids = (
             df["id"].astype(str)
             if "id" in df.columns
@@ -265,20 +269,21 @@ def load_competence_matrix(file_path: Union[str, Path]) -> List[Competence]:
             else pd.Series("", index=df.index)
         ).tolist()
 
-        for id_val, name, desc, axis, level, kw in zip(
-            ids, names, descriptions, axes, levels, keywords_col
-        ):
-            competence = Competence(
+        # Columns are materialised once; enum members resolve via prebuilt
+        # name maps, which raise KeyError for unknown names like Enum[...].
+        return [
+            Competence(
                 id=id_val,
                 name=name,
                 description=desc,
-                axis=BlueDynamicsAxis[str(axis)],
-                level=CompetenceLevel[str(level)],
+                axis=_AXIS_BY_NAME[str(axis)],
+                level=_LEVEL_BY_NAME[str(level)],
                 keywords=kw.split(";"),
             )
-            competences.append(competence)
-
-        return competences
+            for id_val, name, desc, axis, level, kw in zip(
+                ids, names, descriptions, axes, levels, keywords_col
+            )
+        ]
     except ImportError:
         raise ImportError(
             "pandas is required to load competence matrices. Install with: pip install pandas openpyxl"
@@ -2,6 +2,7 @@
 Test suite for morskamary Blue Sociology module
 """
 
+import dataclasses
 import pytest
 from pathlib import Path
 from src.core import (
@@ -50,6 +51,13 @@ class TestCompetence:
         assert comp_dict["axis"] == "T"
         assert comp_dict["level"] == "ADVANCED"
 
+    def test_competence_is_frozen(self):
+        """Test competences are immutable, slotted records"""
+        comp = create_sample_competences()[0]
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            comp.level = CompetenceLevel.EXPERT  # type: ignore[misc]
+        assert not hasattr(comp, "__dict__")
+
 
 class TestMicroCredential:
     """Tests for MicroCredential model"""
@@ -190,6 +198,23 @@ class TestCompetenceMapper:
         assert summary["competences_by_axis"]["MARITIME"] == 1
         assert summary["competences_by_axis"]["OCEANIC"] == 1
 
+    def test_get_summary_sectors_follow_credential_replacement(self, mapper_with_credentials):
+        """Test summary sectors drop a sector once its last credential moves"""
+        assert mapper_with_credentials.get_summary()["sectors"] == ["fisheries"]
+        for cred_id in ("cred_001", "cred_002"):
+            mapper_with_credentials.add_credentials(
+                MicroCredential(
+                    id=cred_id,
+                    title="Port Professional",
+                    competences=["comp_maritime_001"],
+                    description="Moved to ports",
+                    sector="ports",
+                )
+            )
+        summary = mapper_with_credentials.get_summary()
+        assert summary["total_credentials"] == 2
+        assert summary["sectors"] == ["ports"]
+
     def test_get_sector_competences(self, mapper_with_credentials):
         """Test getting competences for a sector"""
         sector_comps = mapper_with_credentials.get_sector_competences("fisheries")
@@ -208,6 +233,23 @@ class TestCompetenceMapper:
         sector_comps = mapper_with_credentials.get_sector_competences("nonexistent")
         assert len(sector_comps) == 0
 
+    def test_get_sector_competences_after_credential_replaced(self, mapper_with_credentials):
+        """Test re-adding a credential id moves it to its new sector"""
+        mapper_with_credentials.add_credentials(
+            MicroCredential(
+                id="cred_002",
+                title="Maritime Professional",
+                competences=["comp_maritime_001", "comp_oceanic_001"],
+                description="Advanced maritime and governance",
+                sector="Ports",
+            )
+        )
+        assert mapper_with_credentials.get_sector_competences("fisheries") == ["comp_marine_001"]
+        assert sorted(mapper_with_credentials.get_sector_competences("ports")) == [
+            "comp_maritime_001",
+            "comp_oceanic_001",
+        ]
+
     def test_analyze_competence_gaps_basic(self, mapper_with_credentials):
         """Test basic gap analysis"""
         gaps = mapper_with_credentials.analyze_competence_gaps(
@@ -267,6 +309,52 @@ class TestCompetenceMapper:
         )
         assert len(pathway) == 2
 
+    def test_suggest_credential_pathway_competence_added_later(self):
+        """Test pathway ordering reflects competences added after credentials"""
+        mapper = CompetenceMapper()
+        mapper.add_credentials(
+            MicroCredential(
+                id="cred_late",
+                title="Late Expert",
+                competences=["comp_expert"],
+                description="References a competence not yet mapped",
+                sector="ports",
+            )
+        )
+        mapper.add_credentials(
+            MicroCredential(
+                id="cred_known",
+                title="Known Foundational",
+                competences=["comp_foundational"],
+                description="References a mapped competence",
+                sector="ports",
+            )
+        )
+        mapper.add_competence(
+            Competence(
+                id="comp_foundational",
+                name="Foundational",
+                description="Foundational",
+                axis=BlueDynamicsAxis.MARINE,
+                level=CompetenceLevel.FOUNDATIONAL,
+                keywords=[],
+            )
+        )
+        # cred_late still averages 0 because comp_expert is unknown
+        assert [c.id for c in mapper.suggest_credential_pathway()] == ["cred_late", "cred_known"]
+
+        mapper.add_competence(
+            Competence(
+                id="comp_expert",
+                name="Expert",
+                description="Expert",
+                axis=BlueDynamicsAxis.OCEANIC,
+                level=CompetenceLevel.EXPERT,
+                keywords=[],
+            )
+        )
+        assert [c.id for c in mapper.suggest_credential_pathway()] == ["cred_known", "cred_late"]
+
 
 class TestDetectAllThemes:
     """Tests for structured theme detection across all QMBD axes."""
@@ -60,6 +60,12 @@ class TestCompetenceLevelEnum:
         assert CompetenceLevel.INTERMEDIATE.value < CompetenceLevel.ADVANCED.value
         assert CompetenceLevel.ADVANCED.value < CompetenceLevel.EXPERT.value
 
+    def test_enum_members_are_ints(self):
+        """Test that levels take part in arithmetic without .value"""
+        assert CompetenceLevel.ADVANCED == 3
+        assert CompetenceLevel.FOUNDATIONAL < CompetenceLevel.EXPERT
+        assert sum([CompetenceLevel.INTERMEDIATE, CompetenceLevel.EXPERT]) == 6
+
 
 class TestNormalizeSectorName:
     """Tests for sector name normalization"""
@@ -284,6 +290,15 @@ class TestCompetenceMapperEdgeCases:
         assert len(mapper.competences) == 1
         # Should be the second one
         assert mapper.competences["comp_001"].name == "Second"
+        # Axis/level lookups and summary should follow the replacement
+        assert mapper.get_competences_by_axis(BlueDynamicsAxis.MARINE) == []
+        assert mapper.get_competences_by_axis(BlueDynamicsAxis.MARITIME) == [comp2]
+        assert mapper.get_competences_by_level(CompetenceLevel.FOUNDATIONAL) == []
+        assert mapper.get_competences_by_level(CompetenceLevel.ADVANCED) == [comp2]
+        summary = mapper.get_summary()
+        assert summary["competences_by_axis"]["MARINE"] == 0
+        assert summary["competences_by_axis"]["MARITIME"] == 1
+        assert summary["competences_by_level"]["ADVANCED"] == 1
 
     def test_analyze_gaps_with_extra_competences(self):
         """Test gap analysis when user has more than required"""